@@ -31,6 +31,7 @@ async def async_setup(hass: HomeAssistant, config: dict):
 
     # Create coordinators for each device
     coordinators = {}
+    endpoints = {}
 
     for device_id, device_config in config[DOMAIN].items():
         host = device_config.get("host")
@@ -41,6 +42,17 @@ async def async_setup(hass: HomeAssistant, config: dict):
             _LOGGER.error(f"No host specified for device {device_id}")
             continue
 
+        # Each DOSA server drives a single door, so a second device on the same
+        # endpoint would only open a duplicate WebSocket to the same controller
+        endpoint = (host, port)
+        if endpoint in endpoints:
+            _LOGGER.error(
+                f"Device {device_id} uses {host}:{port}, already configured for "
+                f"{endpoints[endpoint]}; skipping"
+            )
+            continue
+        endpoints[endpoint] = device_id
+
         coordinator = DosaCoordinator(hass, device_id, name, host, port)
         await coordinator.async_start()
         coordinators[device_id] = coordinator
@@ -29,7 +29,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
             DosaClearAlarmButton(coordinator, device_id),
         ])
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class DosaButtonBase(CoordinatorEntity, ButtonEntity):
@@ -71,10 +71,8 @@ class DosaClient:
             if self._listening:
                 try:
                     # Wait for a response message (status, response, or error)
-                    response = await asyncio.wait_for(
-                        self._response_queue.get(),
-                        timeout=10.0
-                    )
+                    async with asyncio.timeout(10.0):
+                        response = await self._response_queue.get()
                     _LOGGER.debug(f"Received response: {response}")
                     return response
                 except asyncio.TimeoutError:
@@ -169,7 +167,6 @@ class DosaClient:
 
     async def _keepalive_loop(self):
         """Send NOOP commands every 15 seconds to keep connection alive."""
-        import asyncio
         while self._connected:
             try:
                 await asyncio.sleep(15)
@@ -189,7 +186,6 @@ class DosaClient:
         self._listening = True
 
         # Start keepalive task
-        import asyncio
         self._keepalive_task = asyncio.create_task(self._keepalive_loop())
 
         try:
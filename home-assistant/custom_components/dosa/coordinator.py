@@ -33,11 +33,13 @@ class DosaCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=f"DOSA {name}",
             update_interval=timedelta(minutes=5),  # Fallback polling only (WebSocket provides real-time updates)
+            always_update=False,  # Don't notify entities when a poll returns unchanged data
         )
         self.device_id = device_id
         self.host = host
         self.port = port
         self.client = DosaClient(host, port)
+        self._connect_task: Optional[asyncio.Task] = None
         self._listen_task: Optional[asyncio.Task] = None
         self._connected = False
         self._connecting = False
@@ -49,10 +51,15 @@ class DosaCoordinator(DataUpdateCoordinator):
 
     async def async_start(self):
         """Start the coordinator and establish WebSocket connection."""
-        # Connect in background to avoid blocking startup
-        asyncio.create_task(self._async_connect())
+        # Connect in background to avoid blocking startup. Keep a reference to the
+        # task so it can't be garbage collected mid-flight and can be cancelled on shutdown.
+        self._connect_task = self.hass.async_create_background_task(
+            self._async_connect(), name=f"dosa-connect-{self.device_id}"
+        )
         # Start availability monitoring task
-        self._availability_task = asyncio.create_task(self._monitor_availability())
+        self._availability_task = self.hass.async_create_background_task(
+            self._monitor_availability(), name=f"dosa-availability-{self.device_id}"
+        )
 
     async def _async_connect(self):
         """Connect to the WebSocket server and start listening."""
@@ -77,8 +84,8 @@ class DosaCoordinator(DataUpdateCoordinator):
                     self._reconnect_task.cancel()
                     self._reconnect_task = None
                 # Start listening task for push updates (don't await - runs in background)
-                self._listen_task = asyncio.create_task(
-                    self._async_listen_for_updates()
+                self._listen_task = self.hass.async_create_background_task(
+                    self._async_listen_for_updates(), name=f"dosa-listen-{self.device_id}"
                 )
                 _LOGGER.warning(f"[RECONNECT] Successfully connected to DOSA at {self.host}:{self.port}")
             else:
@@ -119,7 +126,9 @@ class DosaCoordinator(DataUpdateCoordinator):
             return  # Already scheduled
 
         _LOGGER.warning(f"[RECONNECT] Scheduling reconnect in {delay} seconds")
-        self._reconnect_task = asyncio.create_task(self._reconnect_after_delay(delay))
+        self._reconnect_task = self.hass.async_create_background_task(
+            self._reconnect_after_delay(delay), name=f"dosa-reconnect-{self.device_id}"
+        )
 
     async def _reconnect_after_delay(self, delay: int):
         """Wait and then attempt to reconnect."""
@@ -213,6 +222,14 @@ class DosaCoordinator(DataUpdateCoordinator):
         self._shutdown = True
         self._connected = False
 
+        # Cancel initial connect task
+        if self._connect_task and not self._connect_task.done():
+            self._connect_task.cancel()
+            try:
+                await self._connect_task
+            except asyncio.CancelledError:
+                pass
+
         # Cancel availability monitor task
         if self._availability_task and not self._availability_task.done():
             self._availability_task.cancel()
@@ -20,26 +20,41 @@ _LOGGER = logging.getLogger(__name__)
 
 # grblHAL alarm code descriptions
 ALARM_CODES = {
-    "1": "Hard limit triggered",
-    "2": "Soft limit triggered",
-    "3": "Abort during cycle",
-    "4": "Probe fail (initial)",
-    "5": "Probe fail (contact)",
-    "6": "Homing fail (reset)",
-    "7": "Homing fail (door)",
-    "8": "Homing fail (pulloff)",
-    "9": "Homing fail (approach)",
-    "10": "Spindle control error",
-    "11": "Homing required",
-    "12": "Limits engaged",
-    "13": "Probe protection",
-    "14": "Spindle at speed timeout",
-    "15": "Homing fail (dual approach)",
-    "16": "Power-on self test (POS) failed",
-    "17": "Motor fault",
-    "18": "Homing fail (autosquaring approach)",
+    1: "Hard limit triggered",
+    2: "Soft limit triggered",
+    3: "Abort during cycle",
+    4: "Probe fail (initial)",
+    5: "Probe fail (contact)",
+    6: "Homing fail (reset)",
+    7: "Homing fail (door)",
+    8: "Homing fail (pulloff)",
+    9: "Homing fail (approach)",
+    10: "Spindle control error",
+    11: "Homing required",
+    12: "Limits engaged",
+    13: "Probe protection",
+    14: "Spindle at speed timeout",
+    15: "Homing fail (dual approach)",
+    16: "Power-on self test (POS) failed",
+    17: "Motor fault",
+    18: "Homing fail (autosquaring approach)",
 }
 
+# Door states grouped for the cover state properties
+_OPENING_STATES = frozenset({"opening", "homing"})
+_CLOSING_STATES = frozenset({"closing", "halting"})
+_NOT_CLOSED_STATES = frozenset({"open", "intermediate", "opening", "closing", "halting", "homing"})
+
+
+def _alarm_description(alarm_code: Any) -> str:
+    """Return a human-readable description for a grblHAL alarm code."""
+    # The server reports codes as strings (e.g. "1"), but accept ints as well
+    try:
+        code = int(alarm_code)
+    except (TypeError, ValueError):
+        code = None
+    return ALARM_CODES.get(code, f"Unknown alarm code: {alarm_code}")
+
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the DOSA cover platform."""
@@ -52,7 +67,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     for device_id, coordinator in coordinators.items():
         entities.append(DosaCover(coordinator, device_id))
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class DosaCover(CoordinatorEntity, CoverEntity):
@@ -72,36 +87,78 @@ class DosaCover(CoordinatorEntity, CoverEntity):
         self._device_id = device_id
         self._attr_unique_id = f"{device_id}_door"
         self._attr_name = f"{coordinator.name} Door"
+        # Device info never changes for the lifetime of the entity, so build it once
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device_id)},
+            name=coordinator.name,
+            manufacturer="DOSA",
+            model="Door Controller",
+        )
+        self._door: dict[str, Any] = {}
+        self._door_state: Optional[str] = None
+        self._position_percent: Optional[float] = None
+        self._attrs: dict[str, Any] = {}
+        self._last_written: Optional[tuple[dict[str, Any], bool]] = None
+        self._update_snapshot()
+
+    def _update_snapshot(self) -> None:
+        """Cache the door state and attributes from the latest coordinator data."""
+        data = self.coordinator.data
+        door = data.get("door") if data else None
+        if door:
+            self._door = door
+            self._door_state = door.get("state")
+            self._position_percent = door.get("position_percent")
+        else:
+            self._door = {}
+            self._door_state = None
+            self._position_percent = None
+        self._attrs = self._build_attributes() if data else {}
+
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build the extra state attributes from the cached door state."""
+        door = self._door
+        attrs = {
+            "state": door.get("state", "unknown"),
+            "position_mm": door.get("position_mm", 0),
+        }
+
+        # Add fault message if present
+        if fault_msg := door.get("fault_message"):
+            attrs["fault_message"] = fault_msg
+
+        # Add alarm information if present
+        if alarm_code := door.get("alarm_code"):
+            attrs["alarm_code"] = alarm_code
+            # Add human-readable alarm description
+            attrs["alarm_description"] = _alarm_description(alarm_code)
+            attrs["has_alarm"] = True
+        else:
+            attrs["has_alarm"] = False
+
+        return attrs
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._update_snapshot()
+        # Skip the state write if neither the door state nor availability changed
+        written = (self._door, self.coordinator.is_available())
+        if written == self._last_written:
+            return
+        self._last_written = written
         super()._handle_coordinator_update()
         _LOGGER.debug(f"Cover entity received coordinator update: {self.coordinator.data}")
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self.coordinator.name,
-            manufacturer="DOSA",
-            model="Door Controller",
-        )
-
     @property
     def is_closed(self) -> Optional[bool]:
         """Return if the cover is closed."""
-        if not self.coordinator.data:
-            return None
-
-        door = self.coordinator.data.get("door", {})
-        state = door.get("state")
+        state = self._door_state
 
         # Return True only if closed, False for all other states except fault/pending
         if state == "closed":
             return True
-        elif state in ("open", "intermediate", "opening", "closing", "halting", "homing"):
+        elif state in _NOT_CLOSED_STATES:
             return False
         # Only return None for truly unknown states (fault, pending, alarm, or missing)
         return None
@@ -109,33 +166,19 @@ class DosaCover(CoordinatorEntity, CoverEntity):
     @property
     def is_opening(self) -> bool:
         """Return if the cover is opening."""
-        if not self.coordinator.data:
-            return False
-
-        door = self.coordinator.data.get("door", {})
-        state = door.get("state")
         # Treat homing as opening since it's a similar motion
-        return state in ("opening", "homing")
+        return self._door_state in _OPENING_STATES
 
     @property
     def is_closing(self) -> bool:
         """Return if the cover is closing."""
-        if not self.coordinator.data:
-            return False
-
-        door = self.coordinator.data.get("door", {})
-        state = door.get("state")
         # Treat halting as closing since it's decelerating/stopping
-        return state in ("closing", "halting")
+        return self._door_state in _CLOSING_STATES
 
     @property
     def current_cover_position(self) -> Optional[int]:
         """Return current position of cover (0 closed, 100 open)."""
-        if not self.coordinator.data:
-            return None
-
-        door = self.coordinator.data.get("door", {})
-        position_percent = door.get("position_percent")
+        position_percent = self._position_percent
 
         if position_percent is not None:
             # Convert to integer (0-100)
@@ -145,31 +188,7 @@ class DosaCover(CoordinatorEntity, CoverEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        if not self.coordinator.data:
-            return {}
-
-        door = self.coordinator.data.get("door", {})
-        attrs = {
-            "state": door.get("state", "unknown"),
-            "position_mm": door.get("position_mm", 0),
-        }
-
-        # Add fault message if present
-        if fault_msg := door.get("fault_message"):
-            attrs["fault_message"] = fault_msg
-
-        # Add alarm information if present
-        if alarm_code := door.get("alarm_code"):
-            attrs["alarm_code"] = alarm_code
-            # Add human-readable alarm description
-            attrs["alarm_description"] = ALARM_CODES.get(
-                alarm_code, f"Unknown alarm code: {alarm_code}"
-            )
-            attrs["has_alarm"] = True
-        else:
-            attrs["has_alarm"] = False
-
-        return attrs
+        return self._attrs
 
     @property
     def available(self) -> bool:
@@ -181,11 +200,8 @@ class DosaCover(CoordinatorEntity, CoverEntity):
         if not self.coordinator.data:
             return False
 
-        door = self.coordinator.data.get("door", {})
-        state = door.get("state")
-
         # Entity is unavailable if in fault state
-        return state != "fault"
+        return self._door_state != "fault"
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
@@ -63,8 +63,8 @@ async def async_setup(hass: HomeAssistant, config: dict):
     # Create client
     client = OverwatchClient(host, port)
 
-    # Test connection
-    if not await hass.async_add_executor_job(client.connect):
+    # Create the channel (connects lazily on the first call)
+    if not client.connect():
         _LOGGER.error(f"Failed to connect to voice server at {host}:{port}")
         return False
 
@@ -84,9 +84,7 @@ async def async_setup(hass: HomeAssistant, config: dict):
         )
 
         try:
-            success, message = await hass.async_add_executor_job(
-                client.set_alarm, alarm_id, enabled, volume
-            )
+            success, message = await client.set_alarm(alarm_id, enabled, volume)
 
             if success:
                 _LOGGER.info(f"Alarm '{alarm_id}' {'started' if enabled else 'stopped'}")
@@ -109,8 +107,8 @@ async def async_setup(hass: HomeAssistant, config: dict):
         )
 
         try:
-            success, message = await hass.async_add_executor_job(
-                client.verbalise, text, notification_tone_id, voice_id, volume
+            success, message = await client.verbalise(
+                text, notification_tone_id, voice_id, volume
             )
 
             if success:
@@ -146,7 +144,7 @@ async def async_unload_entry(hass: HomeAssistant, entry):
     if DOMAIN in hass.data:
         client = hass.data[DOMAIN].get("client")
         if client:
-            await hass.async_add_executor_job(client.disconnect)
+            await client.disconnect()
         hass.data.pop(DOMAIN)
 
     return True
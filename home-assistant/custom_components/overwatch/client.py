@@ -1,4 +1,4 @@
-"""gRPC client for Overwatch voice server."""
+"""Asyncio gRPC client for Overwatch voice server."""
 import logging
 from typing import Optional
 import grpc
@@ -34,9 +34,13 @@ class OverwatchClient:
         self._stub = None
 
     def connect(self):
-        """Create gRPC channel and stub."""
+        """Create gRPC channel and stub.
+
+        The asyncio channel connects lazily, so this does no I/O and is safe to
+        call from the event loop.
+        """
         try:
-            self._channel = grpc.insecure_channel(self.address)
+            self._channel = grpc.aio.insecure_channel(self.address)
             self._stub = voice_pb2_grpc.VoiceServiceStub(self._channel)
             _LOGGER.info(f"Connected to voice server at {self.address}")
             return True
@@ -44,15 +48,15 @@ class OverwatchClient:
             _LOGGER.error(f"Failed to connect to {self.address}: {e}")
             return False
 
-    def disconnect(self):
+    async def disconnect(self):
         """Close the gRPC channel."""
         if self._channel:
-            self._channel.close()
+            await self._channel.close()
             self._channel = None
             self._stub = None
             _LOGGER.info("Disconnected from voice server")
 
-    def set_alarm(
+    async def set_alarm(
         self,
         alarm_id: str,
         enabled: bool,
@@ -81,7 +85,7 @@ class OverwatchClient:
             if volume is not None:
                 request.volume = volume
 
-            response = self._stub.SetAlarm(request, timeout=10.0)
+            response = await self._stub.SetAlarm(request, timeout=10.0)
             _LOGGER.debug(
                 f"SetAlarm response: success={response.success}, message={response.message}"
             )
@@ -94,7 +98,7 @@ class OverwatchClient:
             _LOGGER.error(f"Error in set_alarm: {e}")
             return False, str(e)
 
-    def verbalise(
+    async def verbalise(
         self,
         text: str,
         notification_tone_id: Optional[str] = None,
@@ -126,7 +130,7 @@ class OverwatchClient:
             if volume is not None:
                 request.volume = volume
 
-            response = self._stub.Verbalise(request, timeout=30.0)
+            response = await self._stub.Verbalise(request, timeout=30.0)
             _LOGGER.debug(
                 f"Verbalise response: success={response.success}, message={response.message}"
             )
@@ -139,11 +143,11 @@ class OverwatchClient:
             _LOGGER.error(f"Error in verbalise: {e}")
             return False, str(e)
 
-    def __enter__(self):
-        """Context manager entry."""
+    async def __aenter__(self):
+        """Async context manager entry."""
         self.connect()
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.disconnect()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.disconnect()
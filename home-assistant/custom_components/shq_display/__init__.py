@@ -1,4 +1,5 @@
 """SHQ Display integration for Home Assistant."""
+import asyncio
 import logging
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
@@ -23,6 +24,7 @@ async def async_setup(hass: HomeAssistant, config: dict):
 
     # Create coordinators for each device
     coordinators = {}
+    endpoints = {}
 
     for device_id, device_config in config[DOMAIN].items():
         host = device_config.get("host")
@@ -33,6 +35,17 @@ async def async_setup(hass: HomeAssistant, config: dict):
             _LOGGER.error(f"No host specified for device {device_id}")
             continue
 
+        # Each nyx server drives a single display, so a second device on the same
+        # endpoint would only open a duplicate WebSocket to the same display
+        endpoint = (host, port)
+        if endpoint in endpoints:
+            _LOGGER.error(
+                f"Device {device_id} uses {host}:{port}, already configured for "
+                f"{endpoints[endpoint]}; skipping"
+            )
+            continue
+        endpoints[endpoint] = device_id
+
         coordinator = SHQDisplayCoordinator(hass, device_id, name, host, port)
         await coordinator.async_start()
         coordinators[device_id] = coordinator
@@ -68,16 +81,11 @@ async def async_setup(hass: HomeAssistant, config: dict):
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_shutdown)
 
-    # Forward setup to platforms
-    await discovery.async_load_platform(
-        hass, Platform.LIGHT, DOMAIN, {}, config
-    )
-    await discovery.async_load_platform(
-        hass, Platform.NUMBER, DOMAIN, {}, config
-    )
-    await discovery.async_load_platform(
-        hass, Platform.SENSOR, DOMAIN, {}, config
-    )
+    # Forward setup to platforms (independent of each other, so load concurrently)
+    await asyncio.gather(*(
+        discovery.async_load_platform(hass, platform, DOMAIN, {}, config)
+        for platform in PLATFORMS
+    ))
 
     return True
 
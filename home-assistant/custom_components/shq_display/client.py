@@ -2,11 +2,37 @@
 import asyncio
 import json
 import logging
-from typing import Optional, Dict, Any
+import socket
+from collections import deque
+from typing import Optional, Dict, Any, Deque, Tuple
 import websockets
 
+try:
+    # Home Assistant ships orjson; it decodes frames several times faster than json
+    import orjson
+except ImportError:
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
+# Minimum interval between metrics broadcasts handed to the callback (seconds)
+METRICS_MIN_INTERVAL = 0.5
+
+# TCP keepalive timings, so the OS notices a dead display in ~25s rather than ~2h
+TCP_KEEPALIVE_IDLE = 10
+TCP_KEEPALIVE_INTERVAL = 5
+TCP_KEEPALIVE_COUNT = 3
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        # The server only accepts text frames, so send str rather than bytes
+        return orjson.dumps(obj).decode()
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 
 class SHQDisplayClient:
     """Client for communicating with SHQ Display server."""
@@ -19,13 +45,17 @@ class SHQDisplayClient:
         self._websocket = None
         self._connected = False
         self._keepalive_task = None
-        self._response_queue: asyncio.Queue = asyncio.Queue()
-        self._listening = False
+        # (command type, future) for each command awaiting its reply
+        self._pending: Deque[Tuple[str, asyncio.Future]] = deque()
+        self._last_metrics_time = 0.0
+        self._pending_metrics: Optional[Dict[str, Any]] = None
+        self._metrics_handle: Optional[asyncio.TimerHandle] = None
 
     async def connect(self) -> bool:
         """Connect to the server."""
         try:
             self._websocket = await websockets.connect(self.uri)
+            self._tune_socket()
             self._connected = True
             _LOGGER.info(f"Connected to {self.uri}")
             return True
@@ -34,6 +64,27 @@ class SHQDisplayClient:
             self._connected = False
             return False
 
+    def _tune_socket(self):
+        """Disable Nagle and enable TCP keepalive on the connection's socket."""
+        sock = self._websocket.transport.get_extra_info('socket')
+        if sock is None:
+            return
+
+        try:
+            # Commands are small frames; don't hold them back waiting to coalesce
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Keepalive timing options are platform specific (Linux has all three)
+            for option, value in (
+                ('TCP_KEEPIDLE', TCP_KEEPALIVE_IDLE),
+                ('TCP_KEEPINTVL', TCP_KEEPALIVE_INTERVAL),
+                ('TCP_KEEPCNT', TCP_KEEPALIVE_COUNT),
+            ):
+                if hasattr(socket, option):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+        except OSError as e:
+            _LOGGER.debug(f"Could not set socket options for {self.uri}: {e}")
+
     async def disconnect(self):
         """Disconnect from the server."""
         # Stop keepalive task
@@ -41,7 +92,7 @@ class SHQDisplayClient:
             self._keepalive_task.cancel()
             try:
                 await self._keepalive_task
-            except Exception:
+            except asyncio.CancelledError:
                 pass
 
         if self._websocket:
@@ -49,67 +100,58 @@ class SHQDisplayClient:
             self._connected = False
 
     async def _send_command(self, command: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Send a command and wait for response."""
+        """Send a command and wait for the receive loop to deliver its response."""
+        # Only the receive loop started on a connection reads its replies, so
+        # reconnecting (and restarting that loop) is left to the coordinator
         if not self._connected:
-            if not await self.connect():
-                return None
+            _LOGGER.debug(f"Not connected to {self.uri}, dropping command")
+            return None
 
-        try:
-            # Send command
-            await self._websocket.send(json.dumps(command))
-            _LOGGER.debug(f"Sent command: {command} (listening mode: {self._listening})")
+        payload = _json_dumps(command)
 
-            # If we're in listening mode, wait for response from queue
-            if self._listening:
-                try:
-                    # Wait for a response message (not metrics broadcasts)
-                    while True:
-                        response = await asyncio.wait_for(
-                            self._response_queue.get(),
-                            timeout=10.0
-                        )
-                        # Make sure it's actually a response, not a metrics broadcast that snuck in
-                        if response.get('type') == 'response':
-                            _LOGGER.debug(f"Received response: {response}")
-                            return response
-                        else:
-                            # This shouldn't happen, but if it does, keep waiting
-                            _LOGGER.warning(f"Received non-response message in response queue: {response.get('type')}")
-                except asyncio.TimeoutError:
-                    _LOGGER.error("Timeout waiting for response")
-                    return None
-            else:
-                # Not in listening mode, read directly
-                # Keep reading until we get a response (skip metrics broadcasts)
-                while True:
-                    response = await self._websocket.recv()
-                    data = json.loads(response)
-                    _LOGGER.debug(f"Received message: {data}")
-
-                    # If it's a response, return it
-                    if data.get('type') == 'response':
-                        return data
-                    # If it's a metrics broadcast, skip it and keep reading
-                    elif data.get('type') == 'metrics':
-                        _LOGGER.debug("Skipping metrics broadcast, waiting for response...")
-                        continue
-                    else:
-                        # Unknown message type, return it anyway
-                        return data
+        # The server replies to each command in order, so replies are matched to
+        # pending commands first-in, first-out. Most commands get a response or
+        # error frame; get_metrics is answered with a metrics frame.
+        entry = (command['type'], asyncio.get_running_loop().create_future())
+        self._pending.append(entry)
 
+        try:
+            await self._websocket.send(payload)
+            _LOGGER.debug(f"Sent command: {command}")
         except websockets.exceptions.ConnectionClosed:
             _LOGGER.error("Connection closed")
             self._connected = False
+            self._discard_pending(entry)
             return None
         except Exception as e:
             _LOGGER.error(f"Error sending command: {e}")
             self._connected = False
+            self._discard_pending(entry)
+            return None
+
+        try:
+            async with asyncio.timeout(10.0):
+                response = await entry[1]
+            _LOGGER.debug(f"Received response: {response}")
+            return response
+        except asyncio.TimeoutError:
+            _LOGGER.error("Timeout waiting for response")
+            # The entry stays queued: the server still sends its (late) reply, and
+            # the receive loop discards it there instead of handing it to the next
+            # command
             return None
 
+    def _discard_pending(self, entry: Tuple[str, asyncio.Future]):
+        """Drop a command that never reached the server from the pending queue."""
+        try:
+            self._pending.remove(entry)
+        except ValueError:
+            pass
+
     async def get_metrics(self) -> Optional[Dict[str, Any]]:
         """Get current metrics."""
         response = await self._send_command({'type': 'get_metrics'})
-        return response if response and response.get('success') else None
+        return response if response and response.get('type') == 'metrics' else None
 
     async def set_brightness(self, brightness: int) -> bool:
         """Set brightness (0-10)."""
@@ -170,43 +212,77 @@ class SHQDisplayClient:
 
     async def _keepalive_loop(self):
         """Send NOOP commands every 15 seconds to keep connection alive."""
-        import asyncio
         while self._connected:
             try:
                 await asyncio.sleep(15)
                 if self._connected and self._websocket:
-                    await self._websocket.send(json.dumps({'type': 'noop'}))
+                    # The server acknowledges NOOPs, so send it as a command to keep
+                    # the pending response queue in step
+                    await self._send_command({'type': 'noop'})
                     _LOGGER.debug("Sent keepalive NOOP")
             except Exception as e:
                 _LOGGER.debug(f"Keepalive error: {e}")
                 break
 
+    def _throttle_metrics(self, callback, data: Dict[str, Any]):
+        """Pass metrics to the callback at most once per METRICS_MIN_INTERVAL."""
+        loop = asyncio.get_running_loop()
+        wait = self._last_metrics_time + METRICS_MIN_INTERVAL - loop.time()
+
+        if wait <= 0 and self._metrics_handle is None:
+            self._last_metrics_time = loop.time()
+            callback(data)
+            return
+
+        # Too soon - hold on to the latest broadcast and deliver it once the
+        # interval has elapsed, so the final state is never dropped
+        self._pending_metrics = data
+        if self._metrics_handle is None:
+            self._metrics_handle = loop.call_later(
+                max(wait, 0), self._flush_metrics, callback
+            )
+
+    def _flush_metrics(self, callback):
+        """Deliver the most recent held-back metrics broadcast."""
+        self._metrics_handle = None
+        data, self._pending_metrics = self._pending_metrics, None
+        if data is not None:
+            self._last_metrics_time = asyncio.get_running_loop().time()
+            callback(data)
+
     async def start_receiving(self, callback):
         """Start receiving messages and call callback for each message."""
         if not self._websocket:
             _LOGGER.error("Not connected to server")
             return
 
-        self._listening = True
-
         # Start keepalive task
-        import asyncio
         self._keepalive_task = asyncio.create_task(self._keepalive_loop())
 
         try:
             async for message in self._websocket:
                 try:
-                    data = json.loads(message)
+                    data = _json_loads(message)
                     _LOGGER.debug(f"Received message: {data}")
 
                     msg_type = data.get('type')
 
-                    # Response messages go to the response queue for command handlers
-                    if msg_type == 'response':
-                        await self._response_queue.put(data)
+                    # Responses and errors resolve the oldest pending command;
+                    # a metrics frame resolves it only if it is a get_metrics
+                    if self._pending and (
+                        msg_type in ('response', 'error')
+                        or (msg_type == 'metrics' and self._pending[0][0] == 'get_metrics')
+                    ):
+                        _, future = self._pending.popleft()
+                        if not future.done():
+                            future.set_result(data)
 
-                    # All messages also go to the callback if set
-                    callback(data)
+                    # Metrics broadcasts are rate limited; everything else goes
+                    # straight to the callback
+                    if msg_type == 'metrics':
+                        self._throttle_metrics(callback, data)
+                    else:
+                        callback(data)
 
                 except json.JSONDecodeError:
                     _LOGGER.error(f"Invalid JSON received: {message}")
@@ -216,4 +292,13 @@ class SHQDisplayClient:
             _LOGGER.error(f"Error in receive loop: {e}")
             self._connected = False
         finally:
-            self._listening = False
+            if self._metrics_handle:
+                self._metrics_handle.cancel()
+                self._metrics_handle = None
+            self._pending_metrics = None
+
+            # No more responses will arrive on this connection
+            while self._pending:
+                _, future = self._pending.popleft()
+                if not future.done():
+                    future.set_result(None)
@@ -1,7 +1,8 @@
 """Data update coordinator for SHQ Display integration."""
 import asyncio
 import logging
-import time
+import random
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any, Dict, Optional
 
@@ -15,6 +16,56 @@ _LOGGER = logging.getLogger(__name__)
 # Grace period before marking device unavailable (seconds)
 AVAILABILITY_TIMEOUT = 30
 
+# Reconnect backoff: BASE * 2^attempt seconds, capped at MAX, plus up to JITTER (fraction) extra
+RECONNECT_BASE_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+RECONNECT_JITTER = 0.5
+
+# Delay before sending staged auto-dim changes, so quick successive edits become one write
+AUTO_DIM_DEBOUNCE = 0.2
+
+# Values sent for auto-dim settings the display hasn't reported yet
+AUTO_DIM_DEFAULTS = {
+    'dim_level': 25,
+    'bright_level': 178,
+    'auto_dim_time': 0,
+    'auto_off_time': 0,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class SHQDisplaySnapshot:
+    """The fields entities read from a metrics payload, flattened once per update."""
+
+    brightness: int = 255
+    display_on: bool = True
+    # Auto-dim settings are None until the display reports them
+    dim_level: Optional[int] = None
+    bright_level: Optional[int] = None
+    auto_dim_time: Optional[int] = None
+    auto_off_time: Optional[int] = None
+    version: Optional[str] = None
+    url: Optional[str] = None
+
+    @classmethod
+    def from_metrics(cls, data: Optional[Dict[str, Any]]) -> "SHQDisplaySnapshot":
+        """Build a snapshot from a metrics payload (or an empty one if there's no data)."""
+        if not data:
+            return cls()
+
+        display = data.get('display') or {}
+        auto_dim = data.get('auto_dim') or {}
+        return cls(
+            brightness=display.get('brightness', 255),
+            display_on=display.get('display_on', True),
+            dim_level=auto_dim.get('dim_level'),
+            bright_level=auto_dim.get('bright_level'),
+            auto_dim_time=auto_dim.get('auto_dim_time'),
+            auto_off_time=auto_dim.get('auto_off_time'),
+            version=data.get('version', 'Unknown'),
+            url=data.get('url'),
+        )
+
 
 class SHQDisplayCoordinator(DataUpdateCoordinator):
     """Coordinator to manage SHQ Display data and maintain WebSocket connection."""
@@ -40,19 +91,33 @@ class SHQDisplayCoordinator(DataUpdateCoordinator):
         self.client = SHQDisplayClient(host, port)
         self._listen_task: Optional[asyncio.Task] = None
         self._connected = False
+        self._connect_task: Optional[asyncio.Task] = None
         self._reconnect_task: Optional[asyncio.Task] = None
+        self._reconnect_attempts = 0
         self._shutdown = False
         self._last_update_time: Optional[float] = None
-        self._availability_task: Optional[asyncio.Task] = None
-        self._last_availability_state: bool = False
+        self._availability_handle: Optional[asyncio.TimerHandle] = None
+        self._available: bool = False
         self._connecting = False
+        # What entities read from the latest metrics, rebuilt once per update
+        self.snapshot = SHQDisplaySnapshot()
+        self._auto_dim_changes: Dict[str, int] = {}
+        self._auto_dim_flush: Optional[asyncio.Task] = None
+        # The auto-dim section as it was before the staged changes were patched in
+        self._auto_dim_previous: Optional[Dict[str, Any]] = None
+
+    @callback
+    def async_set_updated_data(self, data: Dict[str, Any]) -> None:
+        """Rebuild the snapshot before notifying entities."""
+        self.snapshot = SHQDisplaySnapshot.from_metrics(data)
+        super().async_set_updated_data(data)
 
     async def async_start(self):
         """Start the coordinator and establish WebSocket connection."""
         # Connect in background to avoid blocking startup
-        asyncio.create_task(self._async_connect())
-        # Start availability monitoring task
-        self._availability_task = asyncio.create_task(self._monitor_availability())
+        self._connect_task = self.hass.async_create_background_task(
+            self._async_connect(), name=f"shq-display-connect-{self.device_id}"
+        )
 
     async def _async_connect(self):
         """Connect to the WebSocket server and start listening."""
@@ -61,26 +126,27 @@ class SHQDisplayCoordinator(DataUpdateCoordinator):
             return
 
         self._connecting = True
-        _LOGGER.info(f"Attempting to connect to SHQ Display at {self.host}:{self.port}")
+        _LOGGER.info("Attempting to connect to SHQ Display at %s:%s", self.host, self.port)
 
         connect_success = False
         try:
             if await self.client.connect():
                 self._connected = True
                 connect_success = True
+                self._reconnect_attempts = 0
                 # Cancel any pending reconnect task
-                if self._reconnect_task and not self._reconnect_task.done():
+                if self._reconnect_task is not None:
                     self._reconnect_task.cancel()
                     self._reconnect_task = None
                 # Start listening task for push updates (don't await - runs in background)
-                self._listen_task = asyncio.create_task(
-                    self._async_listen_for_updates()
+                self._listen_task = self.hass.async_create_background_task(
+                    self._async_listen_for_updates(), name=f"shq-display-listen-{self.device_id}"
                 )
-                _LOGGER.info(f"Successfully connected to SHQ Display at {self.host}:{self.port}")
+                _LOGGER.info("Successfully connected to SHQ Display at %s:%s", self.host, self.port)
             else:
-                _LOGGER.warning(f"Failed to connect to SHQ Display at {self.host}:{self.port}, will retry")
+                _LOGGER.warning("Failed to connect to SHQ Display at %s:%s, will retry", self.host, self.port)
         except Exception as err:
-            _LOGGER.error(f"Error connecting to SHQ Display: {err}")
+            _LOGGER.error("Error connecting to SHQ Display: %s", err)
         finally:
             self._connecting = False
             # Schedule reconnect AFTER resetting _connecting flag
@@ -92,7 +158,7 @@ class SHQDisplayCoordinator(DataUpdateCoordinator):
         try:
             await self.client.start_receiving(self._handle_metrics_update)
         except Exception as err:
-            _LOGGER.error(f"Error in listen task: {err}")
+            _LOGGER.error("Error in listen task: %s", err)
         finally:
             # Connection lost, clean up and schedule reconnect
             self._connected = False
@@ -100,20 +166,29 @@ class SHQDisplayCoordinator(DataUpdateCoordinator):
                 _LOGGER.info("Connection lost, scheduling reconnect...")
                 self._schedule_reconnect()
 
-    def _schedule_reconnect(self, delay: int = 5):
-        """Schedule a reconnection attempt."""
+    def _schedule_reconnect(self, delay: Optional[float] = None):
+        """Schedule a reconnection attempt, with jittered exponential backoff by default."""
         if self._shutdown or self._connected or self._connecting:
             return
 
-        # Cancel any existing reconnect task
-        if self._reconnect_task and not self._reconnect_task.done():
+        # _reconnect_task is only set while a reconnect is waiting to run
+        if self._reconnect_task is not None:
             _LOGGER.debug("Reconnect already scheduled, skipping")
             return  # Already scheduled
 
-        _LOGGER.info(f"Scheduling reconnect in {delay} seconds")
-        self._reconnect_task = asyncio.create_task(self._reconnect_after_delay(delay))
+        if delay is None:
+            # Jitter spreads out reconnects so displays don't all retry in lockstep
+            backoff = RECONNECT_BASE_DELAY * 2 ** self._reconnect_attempts
+            if backoff < RECONNECT_MAX_DELAY:
+                self._reconnect_attempts += 1
+            delay = min(RECONNECT_MAX_DELAY, backoff) * (1 + random.uniform(0, RECONNECT_JITTER))
+
+        _LOGGER.info("Scheduling reconnect in %.1f seconds", delay)
+        self._reconnect_task = self.hass.async_create_background_task(
+            self._reconnect_after_delay(delay), name=f"shq-display-reconnect-{self.device_id}"
+        )
 
-    async def _reconnect_after_delay(self, delay: int):
+    async def _reconnect_after_delay(self, delay: float):
         """Wait and then attempt to reconnect."""
         try:
             await asyncio.sleep(delay)
@@ -129,46 +204,56 @@ class SHQDisplayCoordinator(DataUpdateCoordinator):
         """Handle incoming metrics update from server."""
         # Track last update time for ANY message (including NOOP keepalives)
         # This prevents false unavailable states when device is idle
-        self._last_update_time = time.time()
+        became_available = self._mark_seen()
 
         if data.get('type') == 'metrics':
             # Update coordinator data with new metrics
             self.async_set_updated_data(data)
+        elif became_available and self.data:
+            # Refresh entity availability
+            self.async_set_updated_data(self.data)
 
-    def is_available(self) -> bool:
-        """Check if device is available based on last update time."""
-        if self._last_update_time is None:
-            # No updates received yet, consider unavailable
+    @callback
+    def _mark_seen(self) -> bool:
+        """Record that the device responded; return True if it just became available."""
+        self._last_update_time = self.hass.loop.time()
+
+        # One timer per timeout period rather than one per frame: when it fires it
+        # re-arms itself for whatever is left of the period since the last frame
+        if self._availability_handle is None:
+            self._availability_handle = self.hass.loop.call_later(
+                AVAILABILITY_TIMEOUT, self._check_availability
+            )
+
+        if self._available:
             return False
 
-        time_since_update = time.time() - self._last_update_time
-        return time_since_update < AVAILABILITY_TIMEOUT
-
-    async def _monitor_availability(self):
-        """Periodically check availability and trigger updates when it changes."""
-        while not self._shutdown:
-            try:
-                await asyncio.sleep(10)  # Check every 10 seconds
+        self._available = True
+        _LOGGER.info("Device became available")
+        return True
 
-                current_availability = self.is_available()
+    @callback
+    def _check_availability(self):
+        """Mark the device unavailable once no frame has arrived for AVAILABILITY_TIMEOUT."""
+        self._availability_handle = None
+        remaining = self._last_update_time + AVAILABILITY_TIMEOUT - self.hass.loop.time()
+        if remaining > 0:
+            self._availability_handle = self.hass.loop.call_later(
+                remaining, self._check_availability
+            )
+            return
 
-                # If availability changed, trigger an update to refresh entities
-                if current_availability != self._last_availability_state:
-                    self._last_availability_state = current_availability
-                    if current_availability:
-                        _LOGGER.info("Device became available")
-                    else:
-                        _LOGGER.warning("Device became unavailable (no updates for 30+ seconds)")
+        self._available = False
+        _LOGGER.warning("Device became unavailable (no updates for %s+ seconds)", AVAILABILITY_TIMEOUT)
 
-                    # Trigger coordinator update to refresh entity availability
-                    # Use current data if available, otherwise mark as unavailable
-                    if self.data:
-                        self.async_set_updated_data(self.data)
+        # Trigger coordinator update to refresh entity availability
+        if self.data:
+            self.async_set_updated_data(self.data)
 
-            except asyncio.CancelledError:
-                break
-            except Exception as err:
-                _LOGGER.error(f"Error in availability monitor: {err}")
+    def is_available(self) -> bool:
+        """Check if device is available (a frame arrived within AVAILABILITY_TIMEOUT)."""
+        # Maintained by _mark_seen and _check_availability, so no clock read here
+        return self._available
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch data from API endpoint (fallback polling)."""
@@ -189,11 +274,12 @@ class SHQDisplayCoordinator(DataUpdateCoordinator):
             metrics = await self.client.get_metrics()
             if metrics:
                 # Update last update time on successful poll
-                self._last_update_time = time.time()
+                self._mark_seen()
+                self.snapshot = SHQDisplaySnapshot.from_metrics(metrics)
                 return metrics
             raise UpdateFailed("Failed to get metrics")
         except Exception as err:
-            _LOGGER.error(f"Error fetching data: {err}")
+            _LOGGER.error("Error fetching data: %s", err)
             self._connected = False
             self._schedule_reconnect()
             raise UpdateFailed(f"Error communicating with API: {err}")
@@ -203,29 +289,25 @@ class SHQDisplayCoordinator(DataUpdateCoordinator):
         self._shutdown = True
         self._connected = False
 
-        # Cancel availability monitor task
-        if self._availability_task and not self._availability_task.done():
-            self._availability_task.cancel()
-            try:
-                await self._availability_task
-            except asyncio.CancelledError:
-                pass
-
-        # Cancel reconnect task
-        if self._reconnect_task and not self._reconnect_task.done():
-            self._reconnect_task.cancel()
-            try:
-                await self._reconnect_task
-            except asyncio.CancelledError:
-                pass
-
-        # Cancel listen task
-        if self._listen_task and not self._listen_task.done():
-            self._listen_task.cancel()
-            try:
-                await self._listen_task
-            except asyncio.CancelledError:
-                pass
+        # Stop availability timer
+        if self._availability_handle:
+            self._availability_handle.cancel()
+            self._availability_handle = None
+
+        # Cancel background tasks together so they drain in one pass
+        tasks = [
+            task for task in (
+                self._connect_task,
+                self._reconnect_task,
+                self._listen_task,
+                self._auto_dim_flush,
+            )
+            if task and not task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         await self.client.disconnect()
 
@@ -237,12 +319,95 @@ class SHQDisplayCoordinator(DataUpdateCoordinator):
             return False
 
         try:
-            result = await command_func(*args, **kwargs)
-            # Request immediate update after command
-            await self.async_request_refresh()
-            return result
+            # No refresh needed afterwards: the server broadcasts metrics after every command
+            return await command_func(*args, **kwargs)
         except Exception as err:
-            _LOGGER.error(f"Error sending command: {err}")
+            _LOGGER.error("Error sending command: %s", err)
             self._connected = False
             self._schedule_reconnect()
             return False
+
+    @callback
+    def async_optimistic_patch(self, section: str, **changes: Any) -> Optional[Dict[str, Any]]:
+        """Merge expected changes into a metrics section and notify entities.
+
+        The next metrics broadcast from the server replaces the patched values.
+        Returns the section as it was before the patch (for async_rollback_patch),
+        or None if there was no data to patch.
+        """
+        if not self.data:
+            return None
+
+        previous = self.data.get(section) or {}
+        data = dict(self.data)
+        data[section] = {**previous, **changes}
+        self.async_set_updated_data(data)
+        return previous
+
+    @callback
+    def async_rollback_patch(
+        self, section: str, previous: Dict[str, Any], changes: Dict[str, Any]
+    ):
+        """Undo an optimistic patch whose command failed.
+
+        Only keys still holding the patched value are restored, so anything a
+        broadcast has reported since is kept.
+        """
+        if not self.data:
+            return
+
+        current = self.data.get(section) or {}
+        restored = dict(current)
+        for key, value in changes.items():
+            if current.get(key) != value:
+                continue
+            if key in previous:
+                restored[key] = previous[key]
+            else:
+                restored.pop(key, None)
+
+        if restored != current:
+            data = dict(self.data)
+            data[section] = restored
+            self.async_set_updated_data(data)
+
+    async def async_send_optimistic(
+        self, section: str, changes: Dict[str, Any], command_func, *args
+    ) -> bool:
+        """Patch a metrics section, send a command, and undo the patch if it fails."""
+        previous = self.async_optimistic_patch(section, **changes) if changes else None
+        success = await self.async_send_command(command_func, *args)
+        if not success and previous is not None:
+            self.async_rollback_patch(section, previous, changes)
+        return success
+
+    async def async_patch_auto_dim(self, **changes: int) -> bool:
+        """Update some auto-dim settings, keeping the others at their current values.
+
+        Changes made within AUTO_DIM_DEBOUNCE of each other are merged and sent
+        as a single set_auto_dim_config command.
+        """
+        previous = self.async_optimistic_patch('auto_dim', **changes)
+        self._auto_dim_changes.update(changes)
+        if self._auto_dim_flush is None:
+            self._auto_dim_previous = previous
+            self._auto_dim_flush = self.hass.async_create_task(self._async_flush_auto_dim())
+        # Shield so a cancelled caller doesn't cancel the write other callers wait on
+        return await asyncio.shield(self._auto_dim_flush)
+
+    async def _async_flush_auto_dim(self) -> bool:
+        """Send the staged auto-dim changes merged into the current config."""
+        await asyncio.sleep(AUTO_DIM_DEBOUNCE)
+        self._auto_dim_flush = None
+        changes, self._auto_dim_changes = self._auto_dim_changes, {}
+        previous, self._auto_dim_previous = self._auto_dim_previous, None
+
+        config = {}
+        for key, default in AUTO_DIM_DEFAULTS.items():
+            value = getattr(self.snapshot, key)
+            config[key] = default if value is None else value
+        config.update(changes)
+        success = await self.async_send_command(self.client.set_auto_dim_config, **config)
+        if not success and previous is not None:
+            self.async_rollback_patch('auto_dim', previous, changes)
+        return success
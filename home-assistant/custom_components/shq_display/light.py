@@ -28,7 +28,7 @@ async def async_setup_platform(
     # Get coordinators from hass.data
     coordinators = hass.data.get(DOMAIN, {})
 
-    for device_id, coordinator in coordinators.items():
+    for coordinator in coordinators.values():
         entities.append(SHQDisplayLight(coordinator))
 
     async_add_entities(entities)
@@ -49,24 +49,13 @@ class SHQDisplayLight(CoordinatorEntity, LightEntity):
     @property
     def is_on(self) -> bool:
         """Return true if light is on."""
-        if not self.coordinator.data:
-            return True
-
-        display_data = self.coordinator.data.get('display', {})
-        brightness = display_data.get('brightness', 255)
-        display_on = display_data.get('display_on', True)
-        return display_on and brightness > 0
+        snapshot = self.coordinator.snapshot
+        return snapshot.display_on and snapshot.brightness > 0
 
     @property
     def brightness(self) -> int:
         """Return the brightness of the light (0-255)."""
-        if not self.coordinator.data:
-            return 255
-
-        display_data = self.coordinator.data.get('display', {})
-        brightness = display_data.get('brightness', 255)  # 0-255 scale
-
-        return brightness
+        return self.coordinator.snapshot.brightness  # 0-255 scale
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
@@ -74,17 +63,23 @@ class SHQDisplayLight(CoordinatorEntity, LightEntity):
 
         if brightness is not None:
             # Brightness is already 0-255, no conversion needed
-            await self.coordinator.async_send_command(
+            await self.coordinator.async_send_optimistic(
+                'display', {'brightness': brightness},
                 self.coordinator.client.set_brightness, brightness
             )
         else:
-            # Use wake command to turn on to bright level
-            await self.coordinator.async_send_command(
-                self.coordinator.client.wake
+            # Use wake command to turn on to bright level (wake never lowers brightness)
+            bright_level = self.coordinator.snapshot.bright_level
+            changes = {}
+            if bright_level is not None and self.brightness < bright_level:
+                changes['brightness'] = bright_level
+            await self.coordinator.async_send_optimistic(
+                'display', changes, self.coordinator.client.wake
             )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off using sleep command."""
-        await self.coordinator.async_send_command(
-            self.coordinator.client.sleep
+        # Sleep sets brightness to 0
+        await self.coordinator.async_send_optimistic(
+            'display', {'brightness': 0}, self.coordinator.client.sleep
         )
@@ -24,7 +24,7 @@ async def async_setup_platform(
     # Get coordinators from hass.data
     coordinators = hass.data.get(DOMAIN, {})
 
-    for device_id, coordinator in coordinators.items():
+    for coordinator in coordinators.values():
         entities.append(SHQDisplayVersionSensor(coordinator))
         entities.append(SHQDisplayUrlSensor(coordinator))
 
@@ -45,10 +45,7 @@ class SHQDisplayVersionSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> Optional[str]:
         """Return the version."""
-        if not self.coordinator.data:
-            return None
-
-        return self.coordinator.data.get('version', 'Unknown')
+        return self.coordinator.snapshot.version
 
     @property
     def available(self) -> bool:
@@ -68,9 +65,7 @@ class SHQDisplayUrlSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> Optional[str]:
         """Return the current URL."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get('url')
+        return self.coordinator.snapshot.url
 
     @property
     def available(self) -> bool:
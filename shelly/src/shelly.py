@@ -20,39 +20,40 @@ async def run(
     init: bool,
     calibrate: bool,
     update: bool,
+    no_cache: bool,
+    plain: bool,
 ) -> int:
-    manager = DeviceManager()
+    async with DeviceManager() as manager:
+        if ip:
+            devices = await manager.query_by_ip(list(ip))
+        else:
+            devices = await manager.scan_devices(target_device=device, use_cache=not no_cache)
 
-    if ip:
-        devices = await manager.query_by_ip(list(ip))
-    else:
-        devices = await manager.scan_devices(target_device=device)
+        if not devices:
+            return 1 if (device or ip) else 0
 
-    if not devices:
-        return 1 if (device or ip) else 0
+        display_devices(devices, plain)
 
-    display_devices(devices)
+        if init:
+            await manager.init_devices(devices)
 
-    if init:
-        await manager.init_devices(devices)
+        if calibrate:
+            await manager.calibrate_devices(devices)
 
-    if calibrate:
-        await manager.calibrate_devices(devices)
+        if update:
+            await manager.update_devices(devices)
 
-    if update:
-        await manager.update_devices(devices)
+        # Re-query to verify changes
+        if init or calibrate or update:
+            click.echo("\nRe-scanning to verify changes...")
+            if ip:
+                devices = await manager.query_by_ip(list(ip))
+            else:
+                devices = await manager.scan_devices(target_device=device)
+            if devices:
+                display_devices(devices, plain)
 
-    # Re-query to verify changes
-    if init or calibrate or update:
-        click.echo("\nRe-scanning to verify changes...")
-        if ip:
-            devices = await manager.query_by_ip(list(ip))
-        else:
-            devices = await manager.scan_devices(target_device=device)
-        if devices:
-            display_devices(devices)
-
-    return 0
+        return 0
 
 
 @click.command()
@@ -82,7 +83,25 @@ async def run(
     is_flag=True,
     help="Trigger firmware update on devices with available updates.",
 )
-def cli(device: str | None, ip: tuple[str, ...], init: bool, calibrate: bool, update: bool):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Ignore cached mDNS results and rescan the network.",
+)
+@click.option(
+    "--plain",
+    is_flag=True,
+    help="Print tab-separated text instead of a table (the default when output is piped).",
+)
+def cli(
+    device: str | None,
+    ip: tuple[str, ...],
+    init: bool,
+    calibrate: bool,
+    update: bool,
+    no_cache: bool,
+    plain: bool,
+):
     """
     Shelly Device Management Tool.
 
@@ -94,7 +113,7 @@ def cli(device: str | None, ip: tuple[str, ...], init: bool, calibrate: bool, up
     """
     if device and ip:
         raise click.UsageError("--device and --ip are mutually exclusive.")
-    exit_code = asyncio.run(run(device, ip, init, calibrate, update))
+    exit_code = asyncio.run(run(device, ip, init, calibrate, update, no_cache, plain))
     sys.exit(exit_code)
 
 
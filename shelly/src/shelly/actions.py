@@ -1,66 +1,171 @@
 """DeviceManager - orchestrates discovery and API calls."""
 
 import asyncio
+import os
+import random
+from collections import defaultdict
 from typing import Optional
 
 import click
 import httpx
 
-from shelly.api.base import ShellyAPIClient
+from shelly.api.base import MAX_REQUESTS_PER_HOST, OP_TIMEOUTS, ShellyAPIClient, parse_json
 from shelly.api.gen1 import Gen1Client
 from shelly.api.gen2 import Gen2Client
 from shelly.device import DeviceGeneration, DeviceInfo
-from shelly.discovery import discover_devices
+from shelly.discovery import cached_devices, discover_devices, invalidate_cache
 
+# Default for any request without an entry in OP_TIMEOUTS
 REQUEST_TIMEOUT = 1.0
-CONNECTION_LIMIT = 50
+
+
+def _env_int(name: str, default: int, minimum: int = 1) -> int:
+    """Read an integer >= minimum from the environment, falling back to default."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = minimum - 1
+    if parsed < minimum:
+        click.echo(
+            f"Warning: Ignoring {name}={value!r} (expected an integer >= {minimum}), "
+            f"using {default}",
+            err=True,
+        )
+        return default
+    return parsed
+
+
+# Scans query every device at once, so the pool must not be the bottleneck.
+# Override with SHELLY_MAX_CONNECTIONS / SHELLY_MAX_KEEPALIVE.
+MAX_CONNECTIONS = _env_int("SHELLY_MAX_CONNECTIONS", 1000)
+MAX_KEEPALIVE = _env_int("SHELLY_MAX_KEEPALIVE", 100, minimum=0)
+
+# Query retry backoff: BASE * 2^(attempt-1) seconds, capped at MAX, plus up to JITTER (fraction) extra
+RETRY_BASE_DELAY = 0.2
+RETRY_MAX_DELAY = 5.0
+RETRY_JITTER = 0.5
+# Refused connections get this many retries rather than the full max_retries:
+# usually nothing is listening, but a busy ESP8266 (Gen1) refuses while its
+# few sockets are in use
+CONNECT_ERROR_RETRIES = 1
 
 
 def _make_http_client() -> httpx.AsyncClient:
-    """Create a shared HTTP client with connection pooling."""
+    """Create a shared HTTP client with connection pooling.
+
+    The connection ceiling is well above any realistic device count so that a
+    scan's fan-out never queues waiting for a pool slot (which would surface as
+    PoolTimeout under the 1s request timeout).
+    """
     limits = httpx.Limits(
-        max_connections=CONNECTION_LIMIT,
-        max_keepalive_connections=CONNECTION_LIMIT,
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE,
     )
     return httpx.AsyncClient(timeout=REQUEST_TIMEOUT, limits=limits)
 
 
+def _is_retriable(error: Exception, idempotent: bool = True) -> bool:
+    """Return True for failures worth retrying (network errors, timeouts, 5xx).
+
+    4xx responses (e.g. 401/403 from auth) are never retried. Requests that
+    aren't idempotent are only retried when they can't have reached the device:
+    a 5xx may come after the device has already acted on them.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return idempotent and error.response.status_code >= 500
+    if not idempotent:
+        return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+    return isinstance(error, httpx.TransportError)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Backoff before retry number `attempt` (1-based), with jitter."""
+    # Jitter keeps devices that failed together from retrying in lockstep
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+    return delay * (1 + random.uniform(0, RETRY_JITTER))
+
+
+def _successful(results: list) -> list:
+    """Return the non-exception results of a gather, reporting the failures."""
+    for error in (r for r in results if isinstance(r, Exception)):
+        click.echo(f"  Warning: Device query failed: {error}", err=True)
+    return [r for r in results if not isinstance(r, Exception)]
+
+
 class DeviceManager:
-    """Orchestrates Shelly device discovery and management."""
+    """Orchestrates Shelly device discovery and management.
+
+    Use as an async context manager: one HTTP client (and connection pool) is
+    shared by every scan and action for the lifetime of the manager.
+    """
+
+    def __init__(self) -> None:
+        self._http: Optional[httpx.AsyncClient] = None
+        # Per-IP request limit shared by every client talking to that device,
+        # so one device isn't flooded while requests still fan out across devices
+        self._host_limits: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(MAX_REQUESTS_PER_HOST)
+        )
+
+    async def __aenter__(self) -> "DeviceManager":
+        self._http = _make_http_client()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self._http.aclose()
+        self._http = None
 
     def _make_api_client(
-        self, ip_address: str, device_id: str, shelly_data: dict, http: httpx.AsyncClient
+        self, ip_address: str, device_id: str, shelly_data: dict
     ) -> ShellyAPIClient:
         """Return the appropriate generation client based on /shelly probe data."""
+        host_limit = self._host_limits[ip_address]
         if shelly_data.get("gen", 1) >= 2:
-            return Gen2Client(ip_address, device_id, http)
-        return Gen1Client(ip_address, device_id, http)
+            return Gen2Client(ip_address, device_id, self._http, host_limit)
+        return Gen1Client(ip_address, device_id, self._http, host_limit)
 
-    async def _probe_and_query(
-        self, device_id: str, ip_address: str, http: httpx.AsyncClient
-    ) -> DeviceInfo:
+    def _client_for(self, device: DeviceInfo) -> ShellyAPIClient:
+        """Return the generation client for an already-queried device (no probe)."""
+        host_limit = self._host_limits[device.ip_address]
+        if device.generation == DeviceGeneration.GEN2:
+            return Gen2Client(device.ip_address, device.device_id, self._http, host_limit)
+        return Gen1Client(device.ip_address, device.device_id, self._http, host_limit)
+
+    async def _probe_and_query(self, device_id: str, ip_address: str) -> DeviceInfo:
         """Single /shelly probe, then full query reusing the probe data."""
-        resp = await http.get(f"http://{ip_address}/shelly")
-        shelly_data = resp.json()
-        client = self._make_api_client(ip_address, device_id, shelly_data, http)
+        async with self._host_limits[ip_address]:
+            resp = await self._http.get(
+                f"http://{ip_address}/shelly", timeout=OP_TIMEOUTS["probe"]
+            )
+        resp.raise_for_status()
+        shelly_data = parse_json(resp)
+        client = self._make_api_client(ip_address, device_id, shelly_data)
         return await client.get_device_info(shelly_data=shelly_data)
 
     async def _query_device(
-        self, device_id: str, ip_address: str, http: httpx.AsyncClient, max_retries: int = 3
+        self, device_id: str, ip_address: str, max_retries: int = 3
     ) -> DeviceInfo:
         """Query a single device for its full info, retrying on failure."""
         last_error = None
         for attempt in range(1, max_retries + 1):
             try:
-                return await self._probe_and_query(device_id, ip_address, http)
+                return await self._probe_and_query(device_id, ip_address)
             except Exception as e:
                 last_error = e
-                if attempt < max_retries:
-                    await asyncio.sleep(1)
+                if (
+                    attempt == max_retries
+                    or (isinstance(e, httpx.ConnectError) and attempt > CONNECT_ERROR_RETRIES)
+                    or not _is_retriable(e)
+                ):
+                    break
+                await asyncio.sleep(_retry_delay(attempt))
 
         click.echo(
             f"  Warning: Could not reach {device_id} ({ip_address}) "
-            f"after {max_retries} attempts: {last_error}",
+            f"after {attempt} attempt(s): {last_error}",
             err=True,
         )
         return DeviceInfo(
@@ -73,25 +178,29 @@ class DeviceManager:
     async def query_by_ip(self, ip_addresses: list[str]) -> list[DeviceInfo]:
         """Query devices directly by IP, bypassing mDNS discovery."""
         click.echo(f"Querying {len(ip_addresses)} device(s) by IP...")
-        async with _make_http_client() as http:
-            tasks = [self._query_device(ip, ip, http) for ip in ip_addresses]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        devices = []
-        for result in results:
-            if isinstance(result, Exception):
-                click.echo(f"  Warning: Device query failed: {result}", err=True)
-            else:
-                devices.append(result)
+        tasks = [self._query_device(ip, ip) for ip in ip_addresses]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        devices = _successful(results)
 
         return devices
 
     async def scan_devices(
-        self, target_device: Optional[str] = None
+        self, target_device: Optional[str] = None, use_cache: bool = True
     ) -> list[DeviceInfo]:
-        """Discover and query all Shelly devices (or a specific one)."""
-        click.echo("Scanning for Shelly devices...")
-        discovered = await discover_devices()
+        """Discover and query all Shelly devices (or a specific one).
+
+        Recent discovery results are reused unless use_cache is False, or the
+        target device isn't among them.
+        """
+        discovered = cached_devices() if use_cache else None
+        if discovered and (
+            target_device is None or any(did == target_device for did, _ in discovered)
+        ):
+            click.echo("Using cached device list (--no-cache to rescan)...")
+        else:
+            click.echo("Scanning for Shelly devices...")
+            discovered = await discover_devices()
 
         if not discovered:
             click.echo("No Shelly devices found on the network.")
@@ -108,16 +217,14 @@ class DeviceManager:
                 return []
             discovered = matches
 
-        async with _make_http_client() as http:
-            tasks = [self._query_device(did, ip, http) for did, ip in discovered]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = [self._query_device(did, ip) for did, ip in discovered]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        devices = []
-        for result in results:
-            if isinstance(result, Exception):
-                click.echo(f"  Warning: Device query failed: {result}", err=True)
-            else:
-                devices.append(result)
+        devices = _successful(results)
+
+        # A device that didn't answer may have moved IP; rediscover next time
+        if any(not d.reachable for d in devices):
+            invalidate_cache()
 
         return devices
 
@@ -126,18 +233,35 @@ class DeviceManager:
         device: DeviceInfo,
         action_name: str,
         action_fn,
+        max_retries: int = 3,
+        idempotent: bool = True,
     ) -> bool:
-        """Run an action on a single device with error handling."""
-        try:
-            success = await action_fn()
-            if success:
-                click.echo(f"  {device.device_id}: {action_name} - OK")
-            else:
-                click.echo(f"  {device.device_id}: {action_name} - Failed", err=True)
-            return success
-        except Exception as e:
-            click.echo(f"  {device.device_id}: {action_name} - Error: {e}", err=True)
-            return False
+        """Run an action on a single device with error handling.
+
+        Transient failures are retried with backoff; anything else is reported
+        straight away. Actions that aren't idempotent (calibration, firmware
+        update) are only retried when the device didn't accept the connection.
+        """
+        for attempt in range(1, max_retries + 1):
+            try:
+                success = await action_fn()
+                break
+            except Exception as e:
+                if attempt < max_retries and _is_retriable(e, idempotent):
+                    await asyncio.sleep(_retry_delay(attempt))
+                    continue
+                if isinstance(e, httpx.HTTPStatusError):
+                    message = f"HTTP {e.response.status_code} {e.response.reason_phrase}"
+                else:
+                    message = str(e)
+                click.echo(f"  {device.device_id}: {action_name} - Error: {message}", err=True)
+                return False
+
+        if success:
+            click.echo(f"  {device.device_id}: {action_name} - OK")
+        else:
+            click.echo(f"  {device.device_id}: {action_name} - Failed", err=True)
+        return success
 
     async def init_devices(self, devices: list[DeviceInfo]) -> None:
         """Disable cloud, Bluetooth, and WiFi AP on all reachable devices."""
@@ -148,31 +272,29 @@ class DeviceManager:
 
         click.echo(f"\nInitialising {len(reachable)} device(s)...")
 
-        async with _make_http_client() as http:
-            for device in reachable:
-                resp = await http.get(f"http://{device.ip_address}/shelly")
-                shelly_data = resp.json()
-                client = self._make_api_client(
-                    device.ip_address, device.device_id, shelly_data, http
-                )
-
-                tasks = []
-                if device.cloud_enabled is not False:
-                    tasks.append(self._run_action(device, "Disable cloud", client.disable_cloud))
-                if device.bluetooth_enabled is not None and device.bluetooth_enabled is not False:
-                    tasks.append(self._run_action(device, "Disable Bluetooth", client.disable_bluetooth))
-                if device.wifi_ap_enabled is not False:
-                    tasks.append(self._run_action(device, "Disable WiFi AP", client.disable_wifi_ap))
-                if device.is_dimmer:
-                    tasks.append(self._run_action(
-                        device, "Set transition time 1.0s",
-                        lambda c=client: c.set_transition_time(1.0),
-                    ))
-
-                if tasks:
-                    await asyncio.gather(*tasks)
-                else:
-                    click.echo(f"  {device.device_id}: Already configured")
+        async def _init(device: DeviceInfo):
+            client = self._client_for(device)
+
+            tasks = []
+            if device.cloud_enabled is not False:
+                tasks.append(self._run_action(device, "Disable cloud", client.disable_cloud))
+            if device.bluetooth_enabled is not None and device.bluetooth_enabled is not False:
+                tasks.append(self._run_action(device, "Disable Bluetooth", client.disable_bluetooth))
+            if device.wifi_ap_enabled is not False:
+                tasks.append(self._run_action(device, "Disable WiFi AP", client.disable_wifi_ap))
+            if device.is_dimmer:
+                tasks.append(self._run_action(
+                    device, "Set transition time 1.0s",
+                    lambda c=client: c.set_transition_time(1.0),
+                ))
+
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            else:
+                click.echo(f"  {device.device_id}: Already configured")
+
+        tasks = [_init(d) for d in reachable]
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     async def calibrate_devices(self, devices: list[DeviceInfo]) -> None:
         """Run calibration on dimmer devices."""
@@ -183,17 +305,11 @@ class DeviceManager:
 
         click.echo(f"\nCalibrating {len(dimmers)} dimmer(s)...")
 
-        async with _make_http_client() as http:
-            async def _calibrate(device: DeviceInfo):
-                resp = await http.get(f"http://{device.ip_address}/shelly")
-                shelly_data = resp.json()
-                client = self._make_api_client(
-                    device.ip_address, device.device_id, shelly_data, http
-                )
-                await self._run_action(device, "Calibrate", client.calibrate)
-
-            tasks = [_calibrate(d) for d in dimmers]
-            await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = [
+            self._run_action(d, "Calibrate", self._client_for(d).calibrate, idempotent=False)
+            for d in dimmers
+        ]
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     async def update_devices(self, devices: list[DeviceInfo]) -> None:
         """Trigger firmware update on devices with available updates."""
@@ -207,14 +323,10 @@ class DeviceManager:
 
         click.echo(f"\nUpdating {len(updatable)} device(s)...")
 
-        async with _make_http_client() as http:
-            async def _update(device: DeviceInfo):
-                resp = await http.get(f"http://{device.ip_address}/shelly")
-                shelly_data = resp.json()
-                client = self._make_api_client(
-                    device.ip_address, device.device_id, shelly_data, http
-                )
-                await self._run_action(device, "Firmware update", client.trigger_update)
-
-            tasks = [_update(d) for d in updatable]
-            await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = [
+            self._run_action(
+                d, "Firmware update", self._client_for(d).trigger_update, idempotent=False
+            )
+            for d in updatable
+        ]
+        await asyncio.gather(*tasks, return_exceptions=True)
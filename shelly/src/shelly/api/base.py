@@ -1,21 +1,78 @@
 """Abstract base class for Shelly API clients."""
 
+import asyncio
+import json
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Optional
 
 import httpx
 
-from shelly.device import DeviceInfo
+try:
+    # Optional; parses device JSON several times faster than the stdlib
+    import orjson
+except ImportError:
+    orjson = None
+
+from shelly.device import DeviceInfo, InputMode
+
+# Concurrent requests allowed against one device. Gen1 (ESP8266) devices in
+# particular time out when several requests land at once.
+MAX_REQUESTS_PER_HOST = 2
+
+# Per-operation request timeouts (seconds). Probes fail fast so retries start
+# sooner; firmware updates get long enough not to false-timeout.
+OP_TIMEOUTS = {
+    "probe": 0.5,
+    "settings": 2.0,
+    "status": 2.0,
+    "rpc": 3.0,
+    "update": 10.0,
+}
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def parse_json(resp: httpx.Response) -> Any:
+    """Decode a JSON response body, using orjson when it's installed."""
+    return _json_loads(resp.content)
+
+
+def pack_input_modes(modes: dict[int, InputMode]) -> tuple[InputMode, ...]:
+    """Pack index -> mode pairs into a tuple indexed by input number."""
+    if not modes:
+        return ()
+    return tuple(modes.get(i, InputMode.UNKNOWN) for i in range(max(modes) + 1))
 
 
 class ShellyAPIClient(ABC):
-    """Base class for generation-specific Shelly API clients."""
+    """Base class for generation-specific Shelly API clients.
 
-    def __init__(self, ip_address: str, device_id: str, http: httpx.AsyncClient):
+    Setters return True on success and let transport and HTTP errors propagate,
+    so DeviceManager can decide which failures are worth retrying.
+    """
+
+    def __init__(
+        self,
+        ip_address: str,
+        device_id: str,
+        http: httpx.AsyncClient,
+        host_limit: Optional[asyncio.Semaphore] = None,
+    ):
         self.ip_address = ip_address
         self.device_id = device_id
         self.base_url = f"http://{ip_address}"
         self._http = http
+        # Shared by every client for the same device when supplied by DeviceManager
+        self._host_limit = host_limit or asyncio.Semaphore(MAX_REQUESTS_PER_HOST)
+
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        async with self._host_limit:
+            return await self._http.get(url, **kwargs)
+
+    async def _post(self, url: str, **kwargs) -> httpx.Response:
+        async with self._host_limit:
+            return await self._http.post(url, **kwargs)
 
     @abstractmethod
     async def get_device_info(self, shelly_data: Optional[dict] = None) -> DeviceInfo:
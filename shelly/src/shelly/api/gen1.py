@@ -1,27 +1,46 @@
 """Gen1 Shelly API client (HTTP REST)."""
 
+import asyncio
 from typing import Optional
 
 import httpx
 
-from shelly.api.base import ShellyAPIClient
+from shelly.api.base import OP_TIMEOUTS, ShellyAPIClient, pack_input_modes, parse_json
 from shelly.device import DeviceGeneration, DeviceInfo, InputMode
 
+# Gen1 dimmer device types (SHDM-1, SHDM-2)
+DIMMER_TYPE_PREFIX = "SHDM"
+
+# Gen1 btn_type -> InputMode
+MODE_MAP = {
+    "toggle": InputMode.TOGGLE,
+    "edge": InputMode.EDGE,
+    "detached": InputMode.DETACHED,
+    "momentary": InputMode.BUTTON,
+    "action": InputMode.BUTTON,
+}
+
 
 class Gen1Client(ShellyAPIClient):
     """Client for Gen1 Shelly devices using HTTP REST API."""
 
-    def __init__(self, ip_address: str, device_id: str, http: httpx.AsyncClient):
-        super().__init__(ip_address, device_id, http)
+    def __init__(
+        self,
+        ip_address: str,
+        device_id: str,
+        http: httpx.AsyncClient,
+        host_limit: Optional[asyncio.Semaphore] = None,
+    ):
+        super().__init__(ip_address, device_id, http, host_limit)
 
     async def get_device_info(self, shelly_data: Optional[dict] = None) -> DeviceInfo:
         if shelly_data is None:
-            resp = await self._http.get(f"{self.base_url}/shelly")
-            shelly_data = resp.json()
+            resp = await self._get(f"{self.base_url}/shelly", timeout=OP_TIMEOUTS["probe"])
+            shelly_data = parse_json(resp)
 
         auth_enabled = shelly_data.get("auth", False)
         device_type = shelly_data.get("type", "")
-        is_dimmer = "SHDM" in device_type
+        is_dimmer = device_type.startswith(DIMMER_TYPE_PREFIX)
 
         info = DeviceInfo(
             device_id=self.device_id,
@@ -36,35 +55,35 @@ class Gen1Client(ShellyAPIClient):
         if auth_enabled:
             return info
 
-        # Fetch settings for cloud, AP, input mode, name
-        settings_resp = await self._http.get(f"{self.base_url}/settings")
-        settings = settings_resp.json()
+        # Settings (cloud, AP, input mode, name) and status (update availability,
+        # calibration) are independent, so fetch both at once
+        settings_resp, status_resp = await asyncio.gather(
+            self._get(f"{self.base_url}/settings", timeout=OP_TIMEOUTS["settings"]),
+            self._get(f"{self.base_url}/status", timeout=OP_TIMEOUTS["status"]),
+        )
+        settings = parse_json(settings_resp)
+        status = parse_json(status_resp)
 
-        hostname = settings.get("device", {}).get("hostname", "")
+        get = settings.get
+        hostname = get("device", {}).get("hostname", "")
         if hostname:
             info.device_id = hostname
-        info.name = settings.get("name", "") or hostname
-        info.firmware_version = settings.get("fw", "")
-        info.cloud_enabled = settings.get("cloud", {}).get("enabled", None)
-        info.wifi_ap_enabled = settings.get("ap_roaming", {}).get("enabled", None)
+        info.name = get("name", "") or hostname
+        info.firmware_version = get("fw", "")
+        info.cloud_enabled = get("cloud", {}).get("enabled", None)
 
-        # Check WiFi AP from the ap_roaming or wifi_ap settings
-        ap_config = settings.get("wifi_ap", {})
-        if ap_config:
-            info.wifi_ap_enabled = ap_config.get("enabled", None)
+        # WiFi AP state comes from wifi_ap when present, otherwise ap_roaming
+        ap_config = get("wifi_ap") or get("ap_roaming", {})
+        info.wifi_ap_enabled = ap_config.get("enabled", None)
 
         # Input modes from output components
         info.input_modes = self._parse_input_modes(settings)
 
-        # Fetch status for update availability and calibration
-        status_resp = await self._http.get(f"{self.base_url}/status")
-        status = status_resp.json()
-
         update_info = status.get("update", {})
         info.update_available = update_info.get("has_update", None)
 
         if is_dimmer:
-            lights_settings = settings.get("lights", [])
+            lights_settings = get("lights", [])
             if lights_settings:
                 transition_ms = lights_settings[0].get("transition")
                 if transition_ms is not None:
@@ -76,14 +95,7 @@ class Gen1Client(ShellyAPIClient):
 
         return info
 
-    def _parse_input_modes(self, settings: dict) -> dict[int, InputMode]:
-        mode_map = {
-            "toggle": InputMode.TOGGLE,
-            "edge": InputMode.EDGE,
-            "detached": InputMode.DETACHED,
-            "momentary": InputMode.BUTTON,
-            "action": InputMode.BUTTON,
-        }
+    def _parse_input_modes(self, settings: dict) -> tuple[InputMode, ...]:
         modes = {}
         # Gen1 outputs are in relays[] and/or lights[] arrays
         for outputs in (settings.get("relays", []), settings.get("lights", [])):
@@ -92,16 +104,30 @@ class Gen1Client(ShellyAPIClient):
                     continue
                 btn_type = output.get("btn_type")
                 if btn_type is not None:
-                    modes[i] = mode_map.get(btn_type, InputMode.UNKNOWN)
-        return modes
+                    modes[i] = MODE_MAP.get(btn_type, InputMode.UNKNOWN)
+        return pack_input_modes(modes)
+
+    @staticmethod
+    def _check(resp: httpx.Response) -> bool:
+        """Return True for a 2xx response; raise httpx.HTTPStatusError otherwise.
+
+        Raising (rather than returning False) lets callers tell a rejected
+        request (e.g. 401 with auth enabled) from a transient 5xx worth retrying.
+        """
+        resp.raise_for_status()
+        return True
 
     async def disable_cloud(self) -> bool:
-        resp = await self._http.post(f"{self.base_url}/settings/cloud", data={"enabled": "0"})
-        return resp.status_code == 200
+        resp = await self._post(
+            f"{self.base_url}/settings/cloud", data={"enabled": "0"}, timeout=OP_TIMEOUTS["settings"]
+        )
+        return self._check(resp)
 
     async def disable_wifi_ap(self) -> bool:
-        resp = await self._http.post(f"{self.base_url}/settings/ap", data={"enabled": "0"})
-        return resp.status_code == 200
+        resp = await self._post(
+            f"{self.base_url}/settings/ap", data={"enabled": "0"}, timeout=OP_TIMEOUTS["settings"]
+        )
+        return self._check(resp)
 
     async def disable_bluetooth(self) -> bool:
         # Gen1 devices have no Bluetooth
@@ -109,15 +135,19 @@ class Gen1Client(ShellyAPIClient):
 
     async def set_transition_time(self, seconds: float) -> bool:
         ms = int(seconds * 1000)
-        resp = await self._http.post(
-            f"{self.base_url}/settings/light/0", data={"transition": str(ms)}
+        resp = await self._post(
+            f"{self.base_url}/settings/light/0",
+            data={"transition": str(ms)},
+            timeout=OP_TIMEOUTS["settings"],
         )
-        return resp.status_code == 200
+        return self._check(resp)
 
     async def trigger_update(self) -> bool:
-        resp = await self._http.get(f"{self.base_url}/ota?update=true")
-        return resp.status_code == 200
+        resp = await self._get(f"{self.base_url}/ota?update=true", timeout=OP_TIMEOUTS["update"])
+        return self._check(resp)
 
     async def calibrate(self) -> bool:
-        resp = await self._http.get(f"{self.base_url}/light/0?calibrate=true")
-        return resp.status_code == 200
+        resp = await self._get(
+            f"{self.base_url}/light/0?calibrate=true", timeout=OP_TIMEOUTS["settings"]
+        )
+        return self._check(resp)
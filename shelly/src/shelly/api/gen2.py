@@ -1,44 +1,77 @@
 """Gen2 Shelly API client (JSON-RPC over HTTP)."""
 
+import asyncio
+import itertools
+import re
 from typing import Any, Optional
 
 import httpx
 
-from shelly.api.base import ShellyAPIClient
+from shelly.api.base import OP_TIMEOUTS, ShellyAPIClient, pack_input_modes, parse_json
 from shelly.device import DeviceGeneration, DeviceInfo, InputMode
 
+# Gen2 in_mode -> InputMode
+MODE_MAP = {
+    "follow": InputMode.TOGGLE,
+    "flip": InputMode.EDGE,
+    "detached": InputMode.DETACHED,
+    "momentary": InputMode.BUTTON,
+    "activate": InputMode.BUTTON,
+}
+
+# Dimmers are identified by "dimmer" in the model or "dim" in the app name
+DIMMER_MODEL_TOKEN = "dimmer"
+DIMMER_APP_TOKEN = "dim"
+
+# Indexed component keys such as "light:0" or "switch:1"
+_COMPONENT_KEY_RE = re.compile(r"^[^:]+:(\d+)$")
+
 
 class Gen2Client(ShellyAPIClient):
     """Client for Gen2 Shelly devices using JSON-RPC API."""
 
-    def __init__(self, ip_address: str, device_id: str, http: httpx.AsyncClient):
-        super().__init__(ip_address, device_id, http)
-        self._rpc_id = 0
-
-    async def _rpc_call(self, method: str, params: Optional[dict] = None) -> Any:
-        self._rpc_id += 1
+    def __init__(
+        self,
+        ip_address: str,
+        device_id: str,
+        http: httpx.AsyncClient,
+        host_limit: Optional[asyncio.Semaphore] = None,
+    ):
+        super().__init__(ip_address, device_id, http, host_limit)
+        # Request IDs, unique per client; concurrent calls each take their own
+        self._rpc_ids = itertools.count(1)
+
+    async def _rpc_call(
+        self, method: str, params: Optional[dict] = None, timeout: float = OP_TIMEOUTS["rpc"]
+    ) -> Any:
         payload = {
-            "id": self._rpc_id,
+            "id": next(self._rpc_ids),
             "method": method,
         }
         if params:
             payload["params"] = params
 
-        resp = await self._http.post(f"{self.base_url}/rpc", json=payload)
-        data = resp.json()
+        resp = await self._post(f"{self.base_url}/rpc", json=payload, timeout=timeout)
+        # Surface HTTP failures (401 with auth, 5xx) as HTTPStatusError so callers
+        # can tell them apart, as Gen1Client._check does
+        resp.raise_for_status()
+        data = parse_json(resp)
         if "error" in data:
             raise RuntimeError(f"RPC error: {data['error']}")
         return data.get("result")
 
     async def get_device_info(self, shelly_data: Optional[dict] = None) -> DeviceInfo:
         if shelly_data is None:
-            resp = await self._http.get(f"{self.base_url}/shelly")
-            shelly_data = resp.json()
+            resp = await self._get(f"{self.base_url}/shelly", timeout=OP_TIMEOUTS["probe"])
+            shelly_data = parse_json(resp)
 
         auth_enabled = shelly_data.get("auth_en", False)
         model = shelly_data.get("model", shelly_data.get("app", "Unknown"))
         device_id_from_shelly = shelly_data.get("id", self.device_id)
-        is_dimmer = "dimmer" in model.lower() or "dim" in shelly_data.get("app", "").lower()
+        is_dimmer = (
+            DIMMER_MODEL_TOKEN in model.casefold()
+            or DIMMER_APP_TOKEN in shelly_data.get("app", "").casefold()
+        )
 
         info = DeviceInfo(
             device_id=device_id_from_shelly,
@@ -52,8 +85,14 @@ class Gen2Client(ShellyAPIClient):
         if auth_enabled:
             return info
 
-        # Fetch full config
-        config = await self._rpc_call("Shelly.GetConfig")
+        # Config, update check and (for dimmers) status are independent, so fetch
+        # them concurrently rather than paying a round trip for each
+        calls = [self._rpc_call("Shelly.GetConfig"), self._rpc_call("Shelly.CheckForUpdate")]
+        if is_dimmer:
+            calls.append(self._rpc_call("Shelly.GetStatus"))
+        config, update_result, *status_results = await asyncio.gather(*calls, return_exceptions=True)
+        if isinstance(config, Exception):
+            raise config
 
         # Name
         sys_config = config.get("sys", {})
@@ -84,87 +123,57 @@ class Gen2Client(ShellyAPIClient):
                 info.transition_time = float(transition)
 
         # Status for update and calibration
-        try:
-            update_result = await self._rpc_call("Shelly.CheckForUpdate")
+        if isinstance(update_result, Exception):
+            info.update_available = None
+        else:
             stable = update_result.get("stable", {}) if update_result else {}
             info.update_available = stable.get("version") is not None
-        except Exception:
-            info.update_available = None
 
         if is_dimmer:
-            try:
-                status = await self._rpc_call("Shelly.GetStatus")
+            status = status_results[0]
+            if isinstance(status, Exception) or not status:
+                info.needs_calibration = None
+            else:
                 light_status = status.get("light:0", {})
                 info.needs_calibration = not light_status.get("calibrated", True)
-            except Exception:
-                info.needs_calibration = None
 
         return info
 
-    def _parse_input_modes(self, config: dict) -> dict[int, InputMode]:
-        mode_map = {
-            "follow": InputMode.TOGGLE,
-            "flip": InputMode.EDGE,
-            "detached": InputMode.DETACHED,
-            "momentary": InputMode.BUTTON,
-            "activate": InputMode.BUTTON,
-        }
+    def _parse_input_modes(self, config: dict) -> tuple[InputMode, ...]:
         modes = {}
         for key, value in config.items():
             if not isinstance(value, dict) or "in_mode" not in value:
                 continue
             # Extract index from keys like "light:0", "switch:1"
-            parts = key.split(":")
-            if len(parts) != 2:
-                continue
-            try:
-                idx = int(parts[1])
-            except ValueError:
+            match = _COMPONENT_KEY_RE.match(key)
+            if match is None:
                 continue
             raw = value["in_mode"]
-            modes[idx] = mode_map.get(raw, InputMode.UNKNOWN)
-        return modes
+            modes[int(match.group(1))] = MODE_MAP.get(raw, InputMode.UNKNOWN)
+        return pack_input_modes(modes)
 
     async def disable_cloud(self) -> bool:
-        try:
-            await self._rpc_call("Cloud.SetConfig", {"config": {"enable": False}})
-            return True
-        except Exception:
-            return False
+        await self._rpc_call("Cloud.SetConfig", {"config": {"enable": False}})
+        return True
 
     async def disable_wifi_ap(self) -> bool:
-        try:
-            await self._rpc_call("WiFi.SetConfig", {"config": {"ap": {"enable": False}}})
-            return True
-        except Exception:
-            return False
+        await self._rpc_call("WiFi.SetConfig", {"config": {"ap": {"enable": False}}})
+        return True
 
     async def disable_bluetooth(self) -> bool:
-        try:
-            await self._rpc_call("BLE.SetConfig", {"config": {"enable": False}})
-            return True
-        except Exception:
-            return False
+        await self._rpc_call("BLE.SetConfig", {"config": {"enable": False}})
+        return True
 
     async def set_transition_time(self, seconds: float) -> bool:
-        try:
-            await self._rpc_call(
-                "Light.SetConfig", {"id": 0, "config": {"transition_duration": seconds}}
-            )
-            return True
-        except Exception:
-            return False
+        await self._rpc_call(
+            "Light.SetConfig", {"id": 0, "config": {"transition_duration": seconds}}
+        )
+        return True
 
     async def trigger_update(self) -> bool:
-        try:
-            await self._rpc_call("Shelly.Update")
-            return True
-        except Exception:
-            return False
+        await self._rpc_call("Shelly.Update", timeout=OP_TIMEOUTS["update"])
+        return True
 
     async def calibrate(self) -> bool:
-        try:
-            await self._rpc_call("Light.Calibrate", {"id": 0})
-            return True
-        except Exception:
-            return False
+        await self._rpc_call("Light.Calibrate", {"id": 0})
+        return True
@@ -1,6 +1,6 @@
 """Data models for Shelly devices."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
@@ -19,7 +19,7 @@ class InputMode(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceInfo:
     device_id: str
     ip_address: str
@@ -32,7 +32,8 @@ class DeviceInfo:
     bluetooth_enabled: Optional[bool] = None
     wifi_ap_enabled: Optional[bool] = None
     needs_calibration: Optional[bool] = None
-    input_modes: dict[int, InputMode] = field(default_factory=dict)
+    # Indexed by input number; gaps are InputMode.UNKNOWN
+    input_modes: tuple[InputMode, ...] = ()
     transition_time: Optional[float] = None
     update_available: Optional[bool] = None
     is_dimmer: bool = False
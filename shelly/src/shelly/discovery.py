@@ -1,12 +1,23 @@
 """mDNS discovery for Shelly devices on the local network."""
 
 import asyncio
+import json
+import os
+import threading
+import time
+from pathlib import Path
 from typing import Optional
 
-from zeroconf import ServiceBrowser, ServiceStateChange, Zeroconf
+from zeroconf import DNSQuestionType, ServiceBrowser, ServiceStateChange, Zeroconf
 
 SHELLY_SERVICE_TYPE = "_shelly._tcp.local."
 DEFAULT_SCAN_TIMEOUT = 5
+# Stop scanning once devices have been found and none have appeared for this long
+DEFAULT_QUIET_PERIOD = 1.0
+
+# Discovery results are reused by later runs for this long (seconds)
+CACHE_TTL = 300
+CACHE_PATH = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "shelly" / "devices.json"
 
 
 class ShellyDiscoveryListener:
@@ -14,6 +25,19 @@ class ShellyDiscoveryListener:
 
     def __init__(self):
         self.devices: list[tuple[str, str]] = []
+        # When a service was last announced or resolved
+        self.last_activity = 0.0
+        # Services announced but not yet resolved to an address
+        self.resolving = 0
+        self._lock = threading.Lock()
+        # Set (from the zeroconf thread) whenever discovery state changes
+        self.changed = threading.Event()
+
+    def _touch(self, resolving_delta: int) -> None:
+        with self._lock:
+            self.resolving += resolving_delta
+            self.last_activity = time.monotonic()
+        self.changed.set()
 
     def on_service_state_change(
         self,
@@ -25,43 +49,129 @@ class ShellyDiscoveryListener:
         if state_change is not ServiceStateChange.Added:
             return
 
-        info = zeroconf.get_service_info(service_type, name)
-        if info is None:
-            return
+        # Count the announcement as activity now: resolving it can take seconds
+        self._touch(1)
+        try:
+            info = zeroconf.get_service_info(service_type, name)
+            if info is None:
+                return
 
-        addresses = info.parsed_addresses()
-        if not addresses:
-            return
+            addresses = info.parsed_addresses()
+            if not addresses:
+                return
+
+            ip = addresses[0]
+            # Service name format: "shellyXXXX._shelly._tcp.local."
+            # Extract the device ID from the service name
+            device_id = name.replace(f".{service_type}", "")
+
+            self.devices.append((device_id, ip))
+        finally:
+            self._touch(-1)
 
-        ip = addresses[0]
-        # Service name format: "shellyXXXX._shelly._tcp.local."
-        # Extract the device ID from the service name
-        device_id = name.replace(f".{service_type}", "")
 
-        self.devices.append((device_id, ip))
+def _wait_for_devices(
+    listener: ShellyDiscoveryListener, timeout: float, quiet_period: float
+) -> bool:
+    """Block until discovery goes quiet after finding devices, or the timeout passes.
 
+    Discovery is quiet once nothing has been announced or resolved for
+    quiet_period and no announced service is still being resolved.
 
-def _blocking_discover(timeout: int) -> list[tuple[str, str]]:
-    """Run blocking zeroconf discovery. Called via asyncio.to_thread()."""
+    Returns True if discovery went quiet before the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        now = time.monotonic()
+        remaining = deadline - now
+        if remaining <= 0:
+            return False
+
+        wait = remaining
+        if listener.devices and not listener.resolving:
+            quiet_left = listener.last_activity + quiet_period - now
+            if quiet_left <= 0:
+                return True
+            wait = min(wait, quiet_left)
+
+        listener.changed.wait(wait)
+        listener.changed.clear()
+
+
+def _blocking_discover(
+    timeout: float, quiet_period: float
+) -> tuple[list[tuple[str, str]], bool]:
+    """
+    Run blocking zeroconf discovery. Called via asyncio.to_thread().
+
+    Returns the devices found and whether the scan ended early on the quiet period.
+    """
     zc = Zeroconf()
     listener = ShellyDiscoveryListener()
 
     try:
-        ServiceBrowser(zc, SHELLY_SERVICE_TYPE, handlers=[listener.on_service_state_change])
-        # Wait for devices to be discovered
-        import time
-        time.sleep(timeout)
-        return listener.devices
+        # Ask for unicast (QU) replies so answers come straight back to us
+        ServiceBrowser(
+            zc,
+            SHELLY_SERVICE_TYPE,
+            handlers=[listener.on_service_state_change],
+            question_type=DNSQuestionType.QU,
+        )
+        ended_early = _wait_for_devices(listener, timeout, quiet_period)
+        return list(listener.devices), ended_early
     finally:
         zc.close()
 
 
+def cached_devices() -> Optional[list[tuple[str, str]]]:
+    """Return the cached discovery results, or None if missing or older than CACHE_TTL."""
+    try:
+        if time.time() - CACHE_PATH.stat().st_mtime > CACHE_TTL:
+            return None
+        return [(device_id, ip) for device_id, ip in json.loads(CACHE_PATH.read_text())]
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def invalidate_cache() -> None:
+    """Discard cached discovery results (e.g. when a cached device didn't answer)."""
+    try:
+        CACHE_PATH.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def _save_cache(devices: list[tuple[str, str]]) -> None:
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_PATH.write_text(json.dumps(devices))
+    except OSError:
+        pass
+
+
 async def discover_devices(
-    timeout: int = DEFAULT_SCAN_TIMEOUT,
+    timeout: float = DEFAULT_SCAN_TIMEOUT,
+    quiet_period: float = DEFAULT_QUIET_PERIOD,
 ) -> list[tuple[str, str]]:
     """
     Discover Shelly devices on the local network via mDNS.
 
+    Scanning ends early once at least one device has been found and no new
+    device has appeared for quiet_period seconds; otherwise it runs for timeout.
+
+    Non-empty results are written to the cache read by cached_devices(). A scan
+    cut short by the quiet period may have missed a slow responder, so its
+    results are merged into the still-fresh cache rather than replacing it.
+
     Returns a list of (device_id, ip_address) tuples.
     """
-    return await asyncio.to_thread(_blocking_discover, timeout)
+    devices, ended_early = await asyncio.to_thread(_blocking_discover, timeout, quiet_period)
+    if devices:
+        to_cache = devices
+        if ended_early:
+            # Newly scanned addresses win; devices only the cache knows are kept
+            merged = dict(cached_devices() or [])
+            merged.update(devices)
+            to_cache = list(merged.items())
+        _save_cache(to_cache)
+    return devices
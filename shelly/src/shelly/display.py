@@ -1,133 +1,163 @@
 """Rich table output for Shelly device information."""
 
+import re
+import sys
+from functools import lru_cache
+
 from rich.console import Console
 from rich.table import Table
 
-from shelly.device import DeviceInfo, InputMode
+from shelly.device import DeviceGeneration, DeviceInfo, InputMode
+
+# Shared so repeated calls reuse its style and terminal-size state
+_console = Console()
+
+# Tables with more rows than this drop the lines between rows, which would
+# otherwise double the rendered output
+ROW_LINES_MAX_DEVICES = 30
+
+_COLUMNS = (
+    ("Name / ID", "bold"),
+    ("IP Address", None),
+    ("Gen", None),
+    ("Cloud", None),
+    ("Bluetooth", None),
+    ("WiFi AP", None),
+    ("Calibration", None),
+    ("Transition", None),
+    ("Input Mode", None),
+    ("Update", None),
+)
+
+# The colour tags used in cells below, stripped for plain output
+_MARKUP_TAG = re.compile(r"\[/?(?:dim|green|red|yellow)\]")
+
+# Fixed cell markup, shared by every row
+_NA = "[dim]N/A[/dim]"
+_DASH = "[dim]—[/dim]"
+_AUTH = "[yellow]Auth[/yellow]"
+_CAL_REQUIRED = "[red]Required[/red]"
+_CAL_OK = "[green]OK[/green]"
+
+_GEN_LABEL = {g: str(g.value) for g in DeviceGeneration}
+
+# Cloud / Bluetooth / WiFi AP: Off = good (green), On = bad (red), None = N/A
+_OFF_IS_GOOD = {None: _NA, False: "[green]Off[/green]", True: "[red]On[/red]"}
+
+_UPDATE = {None: _NA, True: "[yellow]Available[/yellow]", False: "[green]Up to date[/green]"}
+
+# Input mode labels: one for a lone input, a shorter one inside "0: ... / 1: ..." lists
+_MODE_LABEL_SINGLE = {
+    m: "[dim]Unknown[/dim]" if m is InputMode.UNKNOWN else m.value.title() for m in InputMode
+}
+_MODE_LABEL = {m: "[dim]?[/dim]" if m is InputMode.UNKNOWN else m.value.title() for m in InputMode}
+
+# Cells after Name / IP Address for devices that couldn't be queried
+_UNREACHABLE_CELLS = ("[dim]?[/dim]",) + (_DASH,) * 6 + ("[dim]Unreachable[/dim]",)
+_AUTH_CELLS = (_AUTH,) * 7
+
+
+@lru_cache(maxsize=256)
+def _transition_label(seconds: float) -> str:
+    """Format a transition time; dimmers mostly share a handful of values."""
+    return f"{seconds:.1f}s"
+
+
+def _device_row(device: DeviceInfo) -> tuple[str, ...]:
+    """Format one device as a tuple of table cells."""
+    name = device.name or device.device_id
+    if not device.reachable:
+        return (
+            f"[dim]{name}[/dim]",
+            f"[dim]{device.ip_address}[/dim]",
+            *_UNREACHABLE_CELLS,
+        )
+
+    if device.auth_enabled:
+        return (
+            name,
+            device.ip_address,
+            _GEN_LABEL[device.generation],
+            *_AUTH_CELLS,
+        )
+
+    cloud = _OFF_IS_GOOD[device.cloud_enabled]
+    # Bluetooth is None (N/A) for Gen1
+    bt = _OFF_IS_GOOD[device.bluetooth_enabled]
+    wifi_ap = _OFF_IS_GOOD[device.wifi_ap_enabled]
+
+    # Calibration and transition time: N/A for non-dimmers
+    if not device.is_dimmer:
+        calibration = transition = _NA
+    else:
+        needs_calibration = device.needs_calibration
+        if needs_calibration:
+            calibration = _CAL_REQUIRED
+        elif needs_calibration is False:
+            calibration = _CAL_OK
+        else:
+            calibration = _NA
+
+        transition_time = device.transition_time
+        transition = _NA if transition_time is None else _transition_label(transition_time)
+
+    # Input modes
+    if not device.input_modes:
+        input_mode = _NA
+    elif len(device.input_modes) == 1:
+        input_mode = _MODE_LABEL_SINGLE[device.input_modes[0]]
+    else:
+        input_mode = " / ".join(
+            f"{idx}: {_MODE_LABEL[mode]}" for idx, mode in enumerate(device.input_modes)
+        )
+
+    update = _UPDATE[device.update_available]
 
+    return (
+        name,
+        device.ip_address,
+        _GEN_LABEL[device.generation],
+        cloud,
+        bt,
+        wifi_ap,
+        calibration,
+        transition,
+        input_mode,
+        update,
+    )
 
-def _status_cell(value: bool | None, good_value: bool, good_text: str, bad_text: str) -> str:
-    """Format a boolean status cell with colour."""
-    if value is None:
-        return "[dim]N/A[/dim]"
-    if value == good_value:
-        return f"[green]{good_text}[/green]"
-    return f"[red]{bad_text}[/red]"
 
+def _print_plain(rows: list[tuple[str, ...]]) -> None:
+    """Write rows as tab-separated plain text, with a header line."""
+    lines = ["\t".join(header for header, _ in _COLUMNS)]
+    lines.extend(_MARKUP_TAG.sub("", "\t".join(row)) for row in rows)
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def display_devices(devices: list[DeviceInfo]) -> None:
-    """Print a Rich table of device information."""
-    console = Console()
 
+def display_devices(devices: list[DeviceInfo], plain: bool = False) -> None:
+    """
+    Print a Rich table of device information.
+
+    With plain=True, or when stdout isn't a terminal, print tab-separated
+    text instead.
+    """
     if not devices:
-        console.print("[yellow]No devices to display.[/yellow]")
+        _console.print("No devices to display.", style="yellow", markup=False, highlight=False)
         return
 
-    table = Table(title="Shelly Devices", show_lines=True)
-    table.add_column("Name / ID", style="bold")
-    table.add_column("IP Address")
-    table.add_column("Gen")
-    table.add_column("Cloud")
-    table.add_column("Bluetooth")
-    table.add_column("WiFi AP")
-    table.add_column("Calibration")
-    table.add_column("Transition")
-    table.add_column("Input Mode")
-    table.add_column("Update")
-
-    for device in sorted(devices, key=lambda d: d.name or d.device_id):
-        if not device.reachable:
-            table.add_row(
-                f"[dim]{device.name or device.device_id}[/dim]",
-                f"[dim]{device.ip_address}[/dim]",
-                "[dim]?[/dim]",
-                "[dim]—[/dim]",
-                "[dim]—[/dim]",
-                "[dim]—[/dim]",
-                "[dim]—[/dim]",
-                "[dim]—[/dim]",
-                "[dim]—[/dim]",
-                "[dim]Unreachable[/dim]",
-            )
-            continue
-
-        if device.auth_enabled:
-            table.add_row(
-                device.name or device.device_id,
-                device.ip_address,
-                str(device.generation.value),
-                "[yellow]Auth[/yellow]",
-                "[yellow]Auth[/yellow]",
-                "[yellow]Auth[/yellow]",
-                "[yellow]Auth[/yellow]",
-                "[yellow]Auth[/yellow]",
-                "[yellow]Auth[/yellow]",
-                "[yellow]Auth[/yellow]",
-            )
-            continue
-
-        name = device.name or device.device_id
-
-        # Cloud: Off = good (green), On = bad (red)
-        cloud = _status_cell(device.cloud_enabled, False, "Off", "On")
-
-        # Bluetooth: N/A for Gen1, Off = good, On = bad
-        bt = _status_cell(device.bluetooth_enabled, False, "Off", "On")
-
-        # WiFi AP: Off = good, On = bad
-        wifi_ap = _status_cell(device.wifi_ap_enabled, False, "Off", "On")
-
-        # Calibration: N/A for non-dimmers
-        if not device.is_dimmer:
-            calibration = "[dim]N/A[/dim]"
-        elif device.needs_calibration:
-            calibration = "[red]Required[/red]"
-        elif device.needs_calibration is False:
-            calibration = "[green]OK[/green]"
-        else:
-            calibration = "[dim]N/A[/dim]"
+    # Format every row first, then feed the table in one tight loop
+    rows = [_device_row(d) for d in sorted(devices, key=lambda d: d.name or d.device_id)]
 
-        # Transition time: N/A for non-dimmers
-        if not device.is_dimmer:
-            transition = "[dim]N/A[/dim]"
-        elif device.transition_time is not None:
-            transition = f"{device.transition_time:.1f}s"
-        else:
-            transition = "[dim]N/A[/dim]"
-
-        # Input modes
-        if not device.input_modes:
-            input_mode = "[dim]N/A[/dim]"
-        elif len(device.input_modes) == 1:
-            mode = next(iter(device.input_modes.values()))
-            input_mode = "[dim]Unknown[/dim]" if mode == InputMode.UNKNOWN else mode.value.title()
-        else:
-            parts = []
-            for idx in sorted(device.input_modes):
-                mode = device.input_modes[idx]
-                label = "[dim]?[/dim]" if mode == InputMode.UNKNOWN else mode.value.title()
-                parts.append(f"{idx}: {label}")
-            input_mode = " / ".join(parts)
-
-        # Update
-        if device.update_available is None:
-            update = "[dim]N/A[/dim]"
-        elif device.update_available:
-            update = "[yellow]Available[/yellow]"
-        else:
-            update = "[green]Up to date[/green]"
+    if plain or not _console.is_terminal:
+        _print_plain(rows)
+        return
 
-        table.add_row(
-            name,
-            device.ip_address,
-            str(device.generation.value),
-            cloud,
-            bt,
-            wifi_ap,
-            calibration,
-            transition,
-            input_mode,
-            update,
-        )
+    table = Table(title="Shelly Devices", show_lines=len(devices) <= ROW_LINES_MAX_DEVICES)
+    for header, style in _COLUMNS:
+        table.add_column(header, style=style)
+
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
 
-    console.print(table)
+    _console.print(table)